@@ -18,12 +18,22 @@ class Settings(BaseSettings):
     # HTTPS Configuration
     HTTP_BASE_URL: str = "https://data-argo.ifremer.fr"
     HTTP_TIMEOUT: int = 30
+    HTTP_MAX_CONCURRENT_DOWNLOADS: int = 10  # Floats downloaded in parallel
+    HTTP_CHUNK_SIZE: int = 128 * 1024  # Bytes per write when streaming downloads
+    HTTP_MAX_CONNECTIONS: int = 200  # Upper bound on open connections
+    HTTP_KEEPALIVE_EXPIRY: float = 75.0  # Seconds an idle connection is kept
+    HTTP_MAX_RETRIES: int = 2  # Retries per file after the first attempt
+    HTTP_RETRY_BACKOFF_BASE: float = 0.5  # Seconds; doubled per attempt, then jittered
+    HTTP_RETRY_BACKOFF_MAX: float = 10.0  # Cap on a single backoff delay
 
     # Data Configuration
     ARGO_DAC: str = "incois"  # Data Assembly Center (incois, aoml, coriolis, etc.)
     LOCAL_STAGE_PATH: Path = Path("/tmp/raw_staging")
     PARQUET_STAGING_PATH: Path = Path("/tmp/parquet_staging")
 
+    # Processing
+    MAX_WORKERS: int = 4  # Processes used to parse floats concurrently
+
     # Environment (prod or dev)
     ENVIRONMENT: str = "prod"
 
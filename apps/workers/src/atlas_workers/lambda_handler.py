@@ -1,9 +1,8 @@
-import asyncio
 import json
 import shutil
 from typing import Any, Dict
 from .config import settings
-from .main import sync
+from .main import run_async, sync
 
 
 def cleanup_tmp():
@@ -44,11 +43,11 @@ def lambda_handler(event: Dict[str, Any], context: Any) -> Dict[str, Any]:
             if not float_id:
                 raise ValueError("float_id required for sync operation")
 
-            result = asyncio.run(sync(float_id=float_id))
+            result = run_async(sync(float_id=float_id))
 
         elif operation == "update":
             # Weekly update (downloads only NEW floats)
-            result = asyncio.run(sync(update=True))
+            result = run_async(sync(update=True))
 
         else:
             raise ValueError(f"Invalid operation: {operation}. Use 'sync' or 'update'")
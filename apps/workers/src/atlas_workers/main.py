@@ -2,14 +2,23 @@ import argparse
 import asyncio
 import sys
 import time
+from collections.abc import Coroutine, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
 from pathlib import Path
-from typing import TypedDict
+from typing import Any, TypedDict
 
+from .config import settings
 from .db import PgClient, S3Client
 from .models import FloatStatus
 from .utils import get_logger
 from .workers import ArgoSyncWorker, NetCDFParserWorker
 
+try:
+    import uvloop
+except ImportError:  # Not available on Windows; the stock asyncio loop is used
+    uvloop = None
+
 logger = get_logger(__name__)
 
 
@@ -25,6 +34,45 @@ class ProcessResult(TypedDict, total=False):
     error: str
 
 
+def run_async(coro: Coroutine[Any, Any, ProcessResult]) -> ProcessResult:
+    """Run a pipeline coroutine, on uvloop's libuv-based event loop if installed."""
+    if uvloop is not None:
+        return uvloop.run(coro)
+    return asyncio.run(coro)
+
+
+def _parse_float(parser: NetCDFParserWorker, fid: str) -> dict[str, Any]:
+    """Parse one float's NetCDF files, returning the error instead of raising."""
+    try:
+        return parser.process_directory(fid)
+    except Exception as e:
+        return {"float_id": fid, "error": str(e)}
+
+
+def _parse_floats(
+    parser: NetCDFParserWorker, float_ids: list[str]
+) -> Iterator[tuple[str, dict[str, Any]]]:
+    """Yield (float_id, result) for each float, in order, parsed in worker processes."""
+    workers = min(settings.MAX_WORKERS, len(float_ids))
+    if workers > 1:
+        try:
+            executor = ProcessPoolExecutor(max_workers=workers)
+        except OSError as e:  # e.g. AWS Lambda, which has no /dev/shm
+            logger.warning("Process pool unavailable, parsing serially", error=str(e))
+        else:
+            try:
+                results = executor.map(_parse_float, repeat(parser), float_ids)
+                yield from zip(float_ids, results, strict=True)
+            finally:
+                # Also runs if the consumer stops early: floats already
+                # submitted but not started are dropped, not parsed
+                executor.shutdown(wait=True, cancel_futures=True)
+            return
+
+    for fid in float_ids:
+        yield fid, _parse_float(parser, fid)
+
+
 async def sync(
     float_id: str | None = None,
     sync_all: bool = False,
@@ -63,12 +111,32 @@ async def sync(
     # 1. Download phase
     download_start = time.time()
 
-    if sync_all:
-        if not skip_download:
-            logger.info("Staring full sync...")
-            sync_result = await sync_worker.syncAll()
+    try:
+        if sync_all:
+            if not skip_download:
+                logger.info("Staring full sync...")
+                sync_result = await sync_worker.syncAll()
+                logger.info(
+                    "SyncAll download completed",
+                    total=sync_result["total"],
+                    downloaded=sync_result["downloaded"],
+                    new=sync_result["new"],
+                    failed=sync_result["failed"],
+                )
+                download_failed = sync_result["failed"]
+                total_floats = sync_result["total"]
+            else:
+                manifest = sync_worker._load_manifest()
+                total_floats = len(manifest["downloaded"])
+
+            manifest = sync_worker._load_manifest()
+            float_ids_to_process = sorted(manifest["downloaded"])
+
+        elif update:
+            logger.info("Starting weekly update sync...")
+            sync_result = await sync_worker.update()
             logger.info(
-                "SyncAll download completed",
+                "Weekly update completed",
                 total=sync_result["total"],
                 downloaded=sync_result["downloaded"],
                 new=sync_result["new"],
@@ -76,47 +144,30 @@ async def sync(
             )
             download_failed = sync_result["failed"]
             total_floats = sync_result["total"]
-        else:
-            manifest = sync_worker._load_manifest()
-            total_floats = len(manifest.get("downloaded", []))
-
-        manifest = sync_worker._load_manifest()
-        float_ids_to_process = manifest.get("downloaded", [])
-
-    elif update:
-        logger.info("Starting weekly update sync...")
-        sync_result = await sync_worker.update()
-        logger.info(
-            "Weekly update completed",
-            total=sync_result["total"],
-            downloaded=sync_result["downloaded"],
-            new=sync_result["new"],
-            failed=sync_result["failed"],
-        )
-        download_failed = sync_result["failed"]
-        total_floats = sync_result["total"]
 
-        # Only process newly downloaded floats from the weekly update
-        manifest = (
-            sync_worker._load_manifest()
-        )  # NOTE: syncALL and upadte uses same manifest file track.
-        float_ids_to_process = manifest.get("downloaded", [])
+            # Only process newly downloaded floats from the weekly update
+            float_ids_to_process = sorted(sync_result["new_float_ids"])
 
-    else:
-        assert float_id is not None
-        if not skip_download:
-            logger.info("Starting single float sync...")
-            download_success = await sync_worker.sync(float_id)  # single float download
-            if not download_success:
-                return {
-                    "success": False,
-                    "float_id": float_id,
-                    "error": f"Failed to download any files for float {float_id}",
-                    "download_failed": 1,
-                    "process_failed": 0,
-                }
-        float_ids_to_process = [float_id]
-        total_floats = 1
+        else:
+            assert float_id is not None
+            if not skip_download:
+                logger.info("Starting single float sync...")
+                download_success = await sync_worker.sync(
+                    float_id
+                )  # single float download
+                if not download_success:
+                    return {
+                        "success": False,
+                        "float_id": float_id,
+                        "error": f"Failed to download any files for float {float_id}",
+                        "download_failed": 1,
+                        "process_failed": 0,
+                    }
+            float_ids_to_process = [float_id]
+            total_floats = 1
+    finally:
+        # Release the pooled HTTP connections once downloads are done
+        await sync_worker.aclose()
 
     timing["download_time"] = time.time() - download_start
 
@@ -159,15 +210,13 @@ async def sync(
     failed_float_ids_list: list[int] = []
 
     try:
-        for fid in float_ids_to_process:
+        # Floats are parsed concurrently; uploads stay in this process in order.
+        # Parse time is the wall-clock time spent waiting on parse results here,
+        # not the workers' summed CPU time, so it stays within total_time.
+        parse_start = time.time()
+        for fid, result in _parse_floats(parser, float_ids_to_process):
+            parse_time_total += time.time() - parse_start
             try:
-                # Parse NetCDF files
-                parse_start = time.time()
-                result = parser.process_directory(
-                    fid
-                )  # FIXME: currently we are itterating through each float. we will do this operation concurrently later.
-                parse_time_total += time.time() - parse_start
-
                 if "error" in result:
                     raise ValueError(f"NetCDF parsing failed: {result['error']}")
 
@@ -239,6 +288,8 @@ async def sync(
             if (sync_all or update) and (processed_count + process_failed) % 10 == 0:
                 db.conn.commit()
 
+            parse_start = time.time()
+
         timing["parse_time"] = parse_time_total
         timing["upload_time"] = upload_time_total
         timing["total_time"] = time.time() - start_time
@@ -343,7 +394,7 @@ def main() -> int:
 
     args = parser.parse_args()
 
-    result = asyncio.run(
+    result = run_async(
         sync(
             float_id=args.float_id,
             sync_all=args.sync_all,
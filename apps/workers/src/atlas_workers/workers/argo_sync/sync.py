@@ -1,9 +1,15 @@
 import asyncio
-import json
+import os
+import random
+from email.utils import formatdate, parsedate_to_datetime
 from pathlib import Path
-from typing import Optional
+from typing import BinaryIO, Optional
 
 import httpx
+import orjson
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
 
 from ... import get_logger, settings
 
@@ -13,8 +19,52 @@ logger = get_logger(__name__)
 INDEX_GLOBAL_META = f"{settings.HTTP_BASE_URL}/ar_index_global_meta.txt"
 INDEX_THIS_WEEK_PROF = f"{settings.HTTP_BASE_URL}/ar_index_this_week_prof.txt"
 
-# Concurrency limit for downloads
-MAX_CONCURRENT_DOWNLOADS = 10
+# Concurrency limit for downloads (floats in flight; each fetches its files at once)
+MAX_CONCURRENT_DOWNLOADS = settings.HTTP_MAX_CONCURRENT_DOWNLOADS
+# Re-chunk response bodies so large files take fewer awaits and write() calls
+DOWNLOAD_CHUNK_SIZE = settings.HTTP_CHUNK_SIZE
+# File buffer for streamed downloads: several chunks are batched per write() syscall
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+# Files fetched per float (meta, tech, prof, Rtraj), all in flight at once
+FILES_PER_FLOAT = 4
+
+# Retry policy for transient download failures (connection errors, 429, 5xx)
+MAX_DOWNLOAD_ATTEMPTS = 1 + max(0, settings.HTTP_MAX_RETRIES)
+RETRY_BACKOFF_BASE = settings.HTTP_RETRY_BACKOFF_BASE
+RETRY_BACKOFF_MAX = settings.HTTP_RETRY_BACKOFF_MAX
+
+# Files at least this large are split into byte ranges fetched over parallel connections
+RANGED_DOWNLOAD_MIN_SIZE = 64 * 1024 * 1024
+RANGED_DOWNLOAD_PARTS = 4
+
+
+class RangeNotSupportedError(Exception):
+    """A server advertised byte ranges but did not serve the range requested."""
+
+
+def _is_transient(error: Exception) -> bool:
+    """Return True if a failed request is worth retrying."""
+    if isinstance(error, httpx.HTTPStatusError):
+        status = error.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(error, httpx.TransportError)
+
+
+def _backoff_delay(attempt: int) -> float:
+    """Exponential backoff with full jitter for the given 0-based attempt."""
+    return random.uniform(0, min(RETRY_BACKOFF_MAX, RETRY_BACKOFF_BASE * 2**attempt))
+
+
+def _stamp_mtime(path: Path, last_modified: Optional[str]) -> None:
+    """Set a downloaded file's mtime from the server's Last-Modified header."""
+    if not last_modified:
+        return
+    try:
+        mtime = parsedate_to_datetime(last_modified).timestamp()
+        os.utime(path, (mtime, mtime))
+    except (TypeError, ValueError, FileNotFoundError):
+        pass  # Unparseable header or nothing written; the write time is a safe mtime
 
 
 class ArgoSyncWorker:
@@ -25,46 +75,311 @@ class ArgoSyncWorker:
         )
         self.stage_path.mkdir(parents=True, exist_ok=True)
         self.manifest_path = self.stage_path / "sync_manifest.json"
+        # Append-only log of results since the last manifest snapshot
+        self.journal_path = self.stage_path / "sync_manifest.jsonl"
+        self._journal: Optional[BinaryIO] = None
+        self._client: Optional[httpx.AsyncClient] = None
 
     # utility methods
-    def _load_manifest(self) -> dict:
-        """Load manifest tracking downloaded floats."""
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the HTTP client shared by the index and all float downloads."""
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                timeout=settings.HTTP_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=settings.HTTP_MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_CONCURRENT_DOWNLOADS
+                    * FILES_PER_FLOAT,
+                    keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY,
+                ),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared HTTP client and the manifest journal."""
+        self._close_journal()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _load_manifest(self) -> dict[str, set[str]]:
+        """Load manifest tracking downloaded floats, replaying the journal."""
+        manifest: dict[str, set[str]] = {"downloaded": set(), "failed": set()}
         if self.manifest_path.exists():
-            with open(self.manifest_path) as f:
-                return json.load(f)
-        return {"downloaded": [], "failed": []}
-
-    def _save_manifest(self, manifest: dict) -> None:
-        """Save manifest to disk."""
-        with open(self.manifest_path, "w") as f:
-            json.dump(manifest, f, indent=2)
-
-    async def _download_index(self, url: str) -> str:
-        """Download and return index file content."""
-        async with httpx.AsyncClient(timeout=settings.HTTP_TIMEOUT) as client:
-            resp = await client.get(url)
+            snapshot = orjson.loads(self.manifest_path.read_bytes())
+            manifest["downloaded"].update(snapshot.get("downloaded", []))
+            manifest["failed"].update(snapshot.get("failed", []))
+
+        if self.journal_path.exists():
+            with open(self.journal_path, "r+b") as f:
+                complete = 0  # End offset of the last whole entry
+                for line in f:
+                    try:
+                        if not line.endswith(b"\n"):
+                            raise ValueError("unterminated entry")
+                        entry = orjson.loads(line)
+                    except ValueError:
+                        # Torn final line from an interrupted write. Cut it off so
+                        # the next append starts on a line of its own.
+                        f.truncate(complete)
+                        break
+                    complete += len(line)
+                    self._apply_result(manifest, entry["float_id"], entry["success"])
+        return manifest
+
+    def _save_manifest(self, manifest: dict[str, set[str]]) -> None:
+        """Save manifest snapshot to disk and drop the journal it supersedes."""
+        snapshot = {key: sorted(float_ids) for key, float_ids in manifest.items()}
+        tmp_path = self.manifest_path.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(orjson.dumps(snapshot, option=orjson.OPT_INDENT_2))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.manifest_path)
+        self._close_journal()
+        self.journal_path.unlink(missing_ok=True)
+
+    def _apply_result(
+        self, manifest: dict[str, set[str]], float_id: str, success: bool
+    ) -> None:
+        """Apply a float sync outcome to the in-memory manifest."""
+        if success:
+            manifest["downloaded"].add(float_id)
+            # Remove from failed set if it was previously marked as failed
+            manifest["failed"].discard(float_id)
+        else:
+            manifest["failed"].add(float_id)
+
+    def _record_result(
+        self, manifest: dict[str, set[str]], float_id: str, success: bool
+    ) -> None:
+        """Record a float sync outcome in the manifest and append it to the journal."""
+        self._apply_result(manifest, float_id, success)
+        if self._journal is None:
+            self._journal = open(self.journal_path, "ab")
+        self._journal.write(
+            orjson.dumps(
+                {"float_id": float_id, "success": success},
+                option=orjson.OPT_APPEND_NEWLINE,
+            )
+        )
+        self._journal.flush()
+
+    def _close_journal(self) -> None:
+        """Close the journal handle kept open across `_record_result` calls."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    async def _download_index(self, url: str) -> Path:
+        """Stream index file to the staging directory and return its path."""
+        index_file = self.stage_path / url.rsplit("/", 1)[-1]
+        async with self._get_client().stream("GET", url) as resp:
             resp.raise_for_status()
-            return resp.text
+            with open(index_file, "wb", buffering=WRITE_BUFFER_SIZE) as f:
+                async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        return index_file
 
-    def _parse_index_for_floats(self, content: str) -> set[str]:
+    def _parse_index_for_floats(self, index_file: Path) -> set[str]:
         """Parse index CSV and extract unique float IDs for our DAC.
 
         Index format: file,date,latitude,longitude,ocean,profiler_type,institution,date_update
         File path format: dac_name/float_id/... or dac_name/float_id/profiles/...
         """
+        # Skip the leading '#' comment block
+        offset = 0
+        with open(index_file, "rb") as f:
+            for line in f:
+                if not line.startswith(b"#"):
+                    break
+                offset += len(line)
+            size = f.seek(0, os.SEEK_END)
+        if offset >= size:
+            return set()
+
+        dac_prefix = f"{self.dac_name}/"
         float_ids: set[str] = set()
-        for line in content.splitlines():
-            if line.startswith("#") or not line.strip():
-                continue
-            parts = line.split(",")
-            if not parts:
-                continue
-            file_path = parts[0]
-            path_parts = file_path.split("/")
-            if len(path_parts) >= 2 and path_parts[0] == self.dac_name:
-                float_ids.add(path_parts[1])
+        with pa.memory_map(str(index_file)) as source:
+            source.seek(offset)
+            reader = pacsv.open_csv(
+                source,
+                # Column header (if any) is kept as a row and dropped by the DAC filter
+                read_options=pacsv.ReadOptions(autogenerate_column_names=True),
+                parse_options=pacsv.ParseOptions(invalid_row_handler=lambda _: "skip"),
+                # Only the path column is converted; the rest are skipped after
+                # tokenizing. Pin its type so every batch agrees with the first.
+                convert_options=pacsv.ConvertOptions(
+                    include_columns=["f0"], column_types={"f0": pa.string()}
+                ),
+            )
+            for batch in reader:
+                file_paths = batch.column(0)
+                file_paths = file_paths.filter(pc.starts_with(file_paths, dac_prefix))
+                parts = pc.split_pattern(file_paths, "/", max_splits=2)
+                float_ids.update(pc.unique(pc.list_element(parts, 1)).to_pylist())
         return float_ids
 
+    async def _download_ranged(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        file_path: Path,
+        size: int,
+        if_range: str,
+    ) -> None:
+        """Download a large file as byte ranges over parallel connections.
+
+        Raises:
+            RangeNotSupportedError: A part came back without a 206 for the
+                exact range requested of a ``size``-byte file.
+        """
+        part_size = -(-size // RANGED_DOWNLOAD_PARTS)  # ceil division
+
+        async def _download_part(fd: int, start: int) -> None:
+            end = min(start + part_size, size) - 1
+            headers = {"Range": f"bytes={start}-{end}", "If-Range": if_range}
+            async with client.stream("GET", url, headers=headers) as resp:
+                resp.raise_for_status()
+                content_range = resp.headers.get("content-range", "")
+                # A different total means the file was replaced since size was read
+                if (
+                    resp.status_code != 206
+                    or content_range != f"bytes {start}-{end}/{size}"
+                ):
+                    raise RangeNotSupportedError(
+                        f"Range {start}-{end} not honoured "
+                        f"(status {resp.status_code}, {content_range!r}): {url}"
+                    )
+                offset = start
+                async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                    os.pwrite(fd, chunk, offset)
+                    offset += len(chunk)
+
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.ftruncate(fd, size)  # Pre-allocate so parts can land in any order
+            # Unlike gather(), a TaskGroup cancels and awaits the remaining parts
+            # when one fails, so none can write to fd after it is closed.
+            async with asyncio.TaskGroup() as tg:
+                for start in range(0, size, part_size):
+                    tg.create_task(_download_part(fd, start))
+        except ExceptionGroup as group:
+            # Surface the first part's error so the retry policy can classify it
+            raise group.exceptions[0] from None
+        finally:
+            os.close(fd)
+
+        logger.debug("Ranged download completed", file=file_path.name, size=size)
+
+    async def _fetch_file(
+        self,
+        client: httpx.AsyncClient,
+        url: str,
+        file_path: Path,
+        ranged: bool = True,
+    ) -> None:
+        """Stream one file to disk, resuming or revalidating any local copy."""
+        headers = {}
+        try:
+            # One stat() both detects a local copy and gives its mtime
+            headers["If-Modified-Since"] = formatdate(
+                file_path.stat().st_mtime, usegmt=True
+            )
+        except FileNotFoundError:
+            pass
+
+        part_path = file_path.with_name(file_path.name + ".part")
+        offset = 0
+        try:
+            part_stat = part_path.stat()
+            if part_stat.st_size:
+                offset = part_stat.st_size
+                headers["Range"] = f"bytes={offset}-"
+                # The .part mtime is the Last-Modified it was cut from
+                headers["If-Range"] = formatdate(part_stat.st_mtime, usegmt=True)
+        except FileNotFoundError:
+            pass
+
+        ranged_size = 0
+        restart = False
+        async with client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304:
+                logger.debug("Not modified", file=file_path.name)
+                part_path.unlink(missing_ok=True)
+                return
+            resuming = resp.status_code == 206
+            if offset and (
+                resp.status_code == 416
+                or (
+                    resuming
+                    and not resp.headers.get("content-range", "").startswith(
+                        f"bytes {offset}-"
+                    )
+                )
+            ):
+                # The partial file no longer lines up with the remote one
+                restart = True
+            else:
+                resp.raise_for_status()
+                last_modified = resp.headers.get("last-modified")
+                # If-Range value for ranged parts (weak ETags are not allowed there)
+                etag = resp.headers.get("etag")
+                validator = (
+                    etag if etag and not etag.startswith("W/") else last_modified
+                )
+                size = int(resp.headers.get("content-length", 0))
+                if (
+                    ranged
+                    and not resuming
+                    and validator
+                    and size >= RANGED_DOWNLOAD_MIN_SIZE
+                    and resp.headers.get("accept-ranges") == "bytes"
+                ):
+                    # Leave the body unread; the ranged requests below take over.
+                    ranged_size = size
+                else:
+                    try:
+                        # Ref: https://www.python-httpx.org/async/
+                        with open(
+                            part_path,
+                            "ab" if resuming else "wb",
+                            buffering=WRITE_BUFFER_SIZE,
+                        ) as f:
+                            async for chunk in resp.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                                f.write(chunk)
+                    finally:
+                        # Also stamps a cut-off body so a retry can resume it
+                        _stamp_mtime(part_path, last_modified)
+
+        if restart:
+            part_path.unlink(missing_ok=True)
+            return await self._fetch_file(client, url, file_path)
+
+        if ranged_size:
+            try:
+                await self._download_ranged(
+                    client, url, part_path, ranged_size, validator
+                )
+            except RangeNotSupportedError as e:
+                logger.warning(
+                    "Range requests not honoured, downloading as one stream",
+                    file=file_path.name,
+                    error=str(e),
+                )
+                part_path.unlink(missing_ok=True)
+                return await self._fetch_file(client, url, file_path, ranged=False)
+            except BaseException:
+                # Parts land out of order, so an unfinished file is not a
+                # prefix a retry could resume
+                part_path.unlink(missing_ok=True)
+                raise
+            _stamp_mtime(part_path, last_modified)
+
+        if resuming:
+            logger.debug("Resumed download", file=file_path.name, offset=offset)
+        os.replace(part_path, file_path)
+
     # sync a single float - Concurrently downloads 4 files for that one float using `gather`.
     async def sync(self, float_id: str) -> bool:
         """Sync the 4 core ARGO files for a specific float concurrently."""
@@ -81,33 +396,47 @@ class ArgoSyncWorker:
         float_dir.mkdir(parents=True, exist_ok=True)
 
         async def _download_file(client: httpx.AsyncClient, filename: str) -> bool:
-            """Download a single file, return True if successful."""
+            """Download a single file, return True if successful.
+
+            Transient failures are retried with jittered exponential backoff;
+            a 404 means the optional file does not exist and is not retried.
+            """
             url = f"{settings.HTTP_BASE_URL}/dac/{self.dac_name}/{float_id}/{filename}"
 
-            try:
-                async with client.stream("GET", url) as resp:
-                    resp.raise_for_status()
-                    file_path = float_dir / filename
-                    with open(file_path, "wb") as f:
-                        async for chunk in resp.aiter_bytes():
-                            f.write(chunk)  # Ref: https://www.python-httpx.org/async/
+            for attempt in range(MAX_DOWNLOAD_ATTEMPTS):
+                try:
+                    await self._fetch_file(client, url, float_dir / filename)
                     logger.debug("Downloaded", file=filename)
                     return True
 
-            except httpx.HTTPStatusError as e:
-                if e.response.status_code == 404:
-                    logger.debug("File not found (optional)", file=filename)
-                else:
-                    logger.error("Failed to download", file=filename, error=str(e))
-                return False
-            except Exception as e:
-                logger.error("Failed to download", file=filename, error=str(e))
-                return False
+                except httpx.HTTPStatusError as e:
+                    if e.response.status_code == 404:
+                        logger.debug("File not found (optional)", file=filename)
+                        return False
+                    error = e
+                except Exception as e:
+                    error = e
+
+                if not _is_transient(error) or attempt == MAX_DOWNLOAD_ATTEMPTS - 1:
+                    logger.error("Failed to download", file=filename, error=str(error))
+                    return False
+
+                delay = _backoff_delay(attempt)
+                logger.warning(
+                    "Retrying download",
+                    file=filename,
+                    attempt=attempt + 1,
+                    delay=round(delay, 2),
+                    error=str(error),
+                )
+                await asyncio.sleep(delay)
+
+            return False
 
-        async with httpx.AsyncClient(timeout=settings.HTTP_TIMEOUT) as client:
-            results = await asyncio.gather(
-                *[_download_file(client, f) for f in files]
-            )  # Ref: https://stackoverflow.com/a/61550673/28193141
+        client = self._get_client()
+        results = await asyncio.gather(
+            *[_download_file(client, f) for f in files]
+        )  # Ref: https://stackoverflow.com/a/61550673/28193141
 
         success_count = sum(results)
         logger.debug(
@@ -115,14 +444,15 @@ class ArgoSyncWorker:
         )
         return success_count >= 1  # At least one file downloaded
 
-    # concurrently downalod multiple floats form DAC - each running their own `sync` (with semaphore to cap total concurrency).
+    # concurrently downalod multiple floats form DAC - a fixed pool of workers each runs `sync` on floats pulled from a queue.
     async def _sync_floats_concurrent(
-        self, float_ids: set[str]
+        self, float_ids: set[str], manifest: dict[str, set[str]]
     ) -> tuple[list[str], list[str]]:
-        """Concurrently sync floats with semaphore limit.
+        """Concurrently sync floats with a fixed pool of download workers.
 
         Args:
             float_ids: Set of float IDs to sync
+            manifest: Manifest to record progress in
 
         Returns:
             Tuple of (successful_float_ids, failed_float_ids)
@@ -130,36 +460,33 @@ class ArgoSyncWorker:
         if not float_ids:
             return [], []
 
-        semaphore = asyncio.Semaphore(MAX_CONCURRENT_DOWNLOADS)
+        queue: asyncio.Queue[str] = asyncio.Queue()
+        for fid in float_ids:
+            queue.put_nowait(fid)
+
         successful: list[str] = []
         failed: list[str] = []
 
-        async def download_with_limit(float_id: str) -> tuple[str, bool]:
-            async with semaphore:
+        async def download_worker() -> None:
+            while True:
+                try:
+                    fid = queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    return
                 try:
-                    success = await self.sync(float_id)
-                    return float_id, success
+                    success = await self.sync(fid)
                 except Exception as e:
-                    logger.error("Float sync failed", float_id=float_id, error=str(e))
-                    return float_id, False
-
-        # Convert to list to maintain order for zip
-        float_ids_list = list(float_ids)
-        tasks = [download_with_limit(fid) for fid in float_ids_list]
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        for fid, result in zip(float_ids_list, results):
-            if isinstance(result, BaseException):
-                logger.error(
-                    "Float sync raised exception", float_id=fid, error=str(result)
-                )
-                failed.append(fid)
-                continue
-            _, success = result
-            if success:
-                successful.append(fid)
-            else:
-                failed.append(fid)
+                    logger.error("Float sync failed", float_id=fid, error=str(e))
+                    success = False
+                (successful if success else failed).append(fid)
+                self._record_result(manifest, fid, success)
+
+        await asyncio.gather(
+            *[
+                download_worker()
+                for _ in range(min(MAX_CONCURRENT_DOWNLOADS, len(float_ids)))
+            ]
+        )
 
         return successful, failed
 
@@ -173,13 +500,13 @@ class ArgoSyncWorker:
 
         # 1. Download and parse global meta index
         logger.info("Downloading global meta index", url=INDEX_GLOBAL_META)
-        content = await self._download_index(INDEX_GLOBAL_META)
-        all_floats = self._parse_index_for_floats(content)
+        index_file = await self._download_index(INDEX_GLOBAL_META)
+        all_floats = self._parse_index_for_floats(index_file)
         logger.info("Found floats in index", count=len(all_floats), dac=self.dac_name)
 
         # 2. Load manifest and determine what needs downloading
         manifest = self._load_manifest()
-        already_downloaded = set(manifest["downloaded"])
+        already_downloaded = manifest["downloaded"]
         pending_floats = all_floats - already_downloaded
 
         logger.info(
@@ -198,22 +525,11 @@ class ArgoSyncWorker:
                 "failed": 0,
             }
 
-        # 3. Run concurrent downloads
+        # 3. Run concurrent downloads (records each result in the manifest)
         successful_floats, failed_floats = await self._sync_floats_concurrent(
-            pending_floats
+            pending_floats, manifest
         )
 
-        # 4. Update manifest
-        for float_id in successful_floats:
-            manifest["downloaded"].append(float_id)
-            # Remove from failed list if it was previously marked as failed
-            if float_id in manifest["failed"]:
-                manifest["failed"].remove(float_id)
-
-        for float_id in failed_floats:
-            if float_id not in manifest["failed"]:
-                manifest["failed"].append(float_id)
-
         # Save manifest
         self._save_manifest(
             manifest
@@ -237,14 +553,15 @@ class ArgoSyncWorker:
     async def update(self) -> dict:
         """Cron update - downlaod the weekly updated floats avalible in ar_index_this_week_prof.txt
 
-        This is designed to run as a Lambda cron job.
+        This is designed to run as a Lambda cron job. The returned
+        ``new_float_ids`` lists only the floats fetched by this run.
         """
         logger.info("Starting weekly update", dac=self.dac_name)
 
         # 1. Download and parse weekly index
         logger.info("Downloading weekly index", url=INDEX_THIS_WEEK_PROF)
-        content = await self._download_index(INDEX_THIS_WEEK_PROF)
-        weekly_floats = self._parse_index_for_floats(content)
+        index_file = await self._download_index(INDEX_THIS_WEEK_PROF)
+        weekly_floats = self._parse_index_for_floats(index_file)
         logger.info(
             "Found floats in weekly index", count=len(weekly_floats), dac=self.dac_name
         )
@@ -256,11 +573,12 @@ class ArgoSyncWorker:
                 "downloaded": 0,
                 "new": 0,
                 "failed": 0,
+                "new_float_ids": [],
             }
 
         # 2. Load manifest and detrmine what needs to downlaod
         manifest = self._load_manifest()
-        already_downloaded = set(manifest["downloaded"])
+        already_downloaded = manifest["downloaded"]
         pending_floats = weekly_floats - already_downloaded
 
         logger.info(
@@ -277,24 +595,14 @@ class ArgoSyncWorker:
                 "downloaded": len(already_downloaded),
                 "new": 0,
                 "failed": 0,
+                "new_float_ids": [],
             }
 
-        # 3. Run concurrent downloads
+        # 3. Run concurrent downloads (records each result in the manifest)
         successful_floats, failed_floats = await self._sync_floats_concurrent(
-            pending_floats
+            pending_floats, manifest
         )
 
-        # 4. Update manifest
-        for float_id in successful_floats:
-            manifest["downloaded"].append(float_id)
-            # Remove from failed list if it was previously marked as failed
-            if float_id in manifest["failed"]:
-                manifest["failed"].remove(float_id)
-
-        for float_id in failed_floats:
-            if float_id not in manifest["failed"]:
-                manifest["failed"].append(float_id)
-
         # Save manifest
         self._save_manifest(
             manifest
@@ -312,4 +620,5 @@ class ArgoSyncWorker:
             "downloaded": len(manifest["downloaded"]),
             "new": len(successful_floats),
             "failed": len(failed_floats),
+            "new_float_ids": successful_floats,
         }
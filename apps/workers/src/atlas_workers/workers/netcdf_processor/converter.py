@@ -1,8 +1,8 @@
-from datetime import datetime, timezone
 from pathlib import Path
 
 import numpy as np
 import pyarrow as pa
+import pyarrow.compute as pc
 import pyarrow.parquet as pq
 import xarray as xr
 
@@ -10,6 +10,62 @@ from ... import get_logger, settings
 
 logger = get_logger(__name__)
 
+# Parquet layout read by the DuckDB agent, one row per measurement. Types are
+# fixed here, not inferred per file, so a float with no BGC sensors still
+# writes DOUBLE/VARCHAR columns rather than Arrow nulls.
+PROFILE_SCHEMA = pa.schema(
+    [
+        ("float_id", pa.int64()),
+        ("cycle_number", pa.float64()),
+        ("level", pa.int64()),
+        ("profile_timestamp", pa.timestamp("us", tz="UTC")),
+        ("latitude", pa.float64()),
+        ("longitude", pa.float64()),
+        ("pressure", pa.float64()),
+        ("temperature", pa.float64()),
+        ("salinity", pa.float64()),
+        ("position_qc", pa.string()),
+        ("pres_qc", pa.string()),
+        ("temp_qc", pa.string()),
+        ("psal_qc", pa.string()),
+        ("temperature_adj", pa.float64()),
+        ("salinity_adj", pa.float64()),
+        ("pressure_adj", pa.float64()),
+        ("temp_adj_qc", pa.string()),
+        ("psal_adj_qc", pa.string()),
+        ("data_mode", pa.string()),
+        ("oxygen", pa.float64()),
+        ("oxygen_qc", pa.string()),
+        ("chlorophyll", pa.float64()),
+        ("chlorophyll_qc", pa.string()),
+        ("nitrate", pa.float64()),
+        ("nitrate_qc", pa.string()),
+        ("year", pa.int64()),
+        ("month", pa.int64()),
+    ]
+)
+
+
+def _arrow_values(values: np.ndarray, type_: pa.DataType) -> pa.Array:
+    """Arrow array of NetCDF values, with nulls for NaN/fill cells."""
+    if values.dtype.kind == "f":
+        # Straight from the NumPy buffer; no per-cell Python objects
+        return pa.array(values, type=type_, mask=np.isnan(values))
+    if values.dtype.kind in "iu":
+        return pa.array(values, type=type_)
+    # Char variables decode to object arrays of bytes, with NaN where filled
+    chars = pa.array(values, type=pa.binary(), from_pandas=True)
+    return pc.utf8_trim_whitespace(chars.cast(pa.string()))
+
+
+def _level_array(
+    arr: np.ndarray | None, mask: np.ndarray, n: int, type_: pa.DataType
+) -> pa.Array:
+    """Arrow array of ``arr[mask]``, or ``n`` nulls if the variable is missing."""
+    if arr is None:
+        return pa.nulls(n, type_)
+    return _arrow_values(arr[mask], type_)
+
 
 class ParquetConverter:
     """Convert ARGO NetCDF profiles to Parquet (denormalized long format)."""
@@ -18,210 +74,173 @@ class ParquetConverter:
         self.staging_path = Path(staging_path or settings.PARQUET_STAGING_PATH)
         self.staging_path.mkdir(parents=True, exist_ok=True)
 
-    def convert(self, prof_file: Path, float_id: str) -> str | None:
-        """Convert prof.nc to Parquet file.
+    def convert_dataset(self, ds: xr.Dataset, float_id: str) -> str | None:
+        """Convert an open prof.nc dataset to Parquet file.
 
         Returns:
             Path to generated Parquet file, or None on failure
         """
-        if not prof_file.exists():
-            logger.warning("Profile file not found", float_id=float_id)
-            return None
-
         try:
-            with xr.open_dataset(prof_file) as ds:
-                n_prof = ds.sizes.get("N_PROF", 0)
-                n_levels = ds.sizes.get("N_LEVELS", 0)
-
-                if n_prof == 0 or n_levels == 0:
-                    logger.warning("Empty dataset", float_id=float_id)
-                    return None
-
-                rows = []
-
-                # Extract required arrays
-                float_ids = ds["PLATFORM_NUMBER"].values
-                cycles = ds["CYCLE_NUMBER"].values
-                juldays = ds["JULD"].values
-                lats = ds["LATITUDE"].values
-                lons = ds["LONGITUDE"].values
-
-                # Optional 2D arrays - safely extract
-                def get_2d_array(var_name: str) -> np.ndarray | None:
-                    arr = ds.get(var_name)
-                    if arr is not None and arr.shape == (n_prof, n_levels):
-                        return arr.values
-                    return None
-
-                def get_1d_array(var_name: str) -> np.ndarray | None:
-                    arr = ds.get(var_name)
-                    if (
-                        arr is not None
-                        and len(arr.shape) == 1
-                        and arr.shape[0] == n_prof
-                    ):
-                        return arr.values
+            n_prof = ds.sizes.get("N_PROF", 0)
+            n_levels = ds.sizes.get("N_LEVELS", 0)
+
+            if n_prof == 0 or n_levels == 0:
+                logger.warning("Empty dataset", float_id=float_id)
+                return None
+
+            # Extract required arrays
+            float_ids = ds["PLATFORM_NUMBER"].values
+            cycles = ds["CYCLE_NUMBER"].values
+            juldays = ds["JULD"].values
+            lats = ds["LATITUDE"].values
+            lons = ds["LONGITUDE"].values
+
+            # Optional arrays - safely extract. Membership is checked against
+            # a set first: a missing name (BGC variables, usually) would
+            # otherwise go through xarray's KeyError/virtual-variable path.
+            present = set(ds.variables)
+
+            def get_2d_array(var_name: str) -> np.ndarray | None:
+                if var_name not in present:
                     return None
+                arr = ds[var_name]
+                if arr.shape == (n_prof, n_levels):
+                    return arr.values
+                return None
 
-                # 2D measurement arrays
-                pressures = get_2d_array("PRES")
-                pres_qc = get_2d_array("PRES_QC")
-                temps = get_2d_array("TEMP")
-                temp_qc = get_2d_array("TEMP_QC")
-                salts = get_2d_array("PSAL")
-                salt_qc = get_2d_array("PSAL_QC")
-
-                # Adjusted values (2D)
-                pres_adj = get_2d_array("PRES_ADJUSTED")
-                temp_adj = get_2d_array("TEMP_ADJUSTED")
-                salt_adj = get_2d_array("PSAL_ADJUSTED")
-                temp_adj_qc = get_2d_array("TEMP_ADJUSTED_QC")
-                salt_adj_qc = get_2d_array("PSAL_ADJUSTED_QC")
-
-                # 1D per-profile arrays
-                data_mode = get_1d_array("DATA_MODE")
-                pos_qc = get_1d_array("POSITION_QC")
-
-                # FIXME: I was planning to make o2 , n2 these double but im getting int with duckdb. need to investigate
-                # BGC sensors (often sparse, 2D)
-                oxygen = get_2d_array("OXYGEN")
-                oxygen_qc = get_2d_array("OXYGEN_QC")
-                chlorophyll = get_2d_array("CHLOROPHYLL")
-                chlorophyll_qc = get_2d_array("CHLOROPHYLL_QC")
-                nitrate = get_2d_array("NITRATE")
-                nitrate_qc = get_2d_array("NITRATE_QC")
-
-                # Helper to safely extract value
-                def get_value(arr: np.ndarray | None, i: int, j: int):
-                    if arr is None:
-                        return None
-                    try:
-                        val = arr[i, j]
-                        if isinstance(val, (bytes, np.bytes_)):
-                            return val.decode("utf-8", errors="ignore").strip()
-                        if isinstance(val, (np.floating, float)):
-                            return None if np.isnan(val) else float(val)
-                        if isinstance(val, (np.integer, int)):
-                            return int(val)
-                        return val
-                    except (IndexError, TypeError, ValueError):
-                        return None
-
-                def get_1d_value(arr: np.ndarray | None, i: int):
-                    if arr is None:
-                        return None
-                    try:
-                        val = arr[i]
-                        if isinstance(val, (bytes, np.bytes_)):
-                            return val.decode("utf-8", errors="ignore").strip()
-                        if isinstance(val, (np.floating, float)):
-                            return None if np.isnan(val) else float(val)
-                        if isinstance(val, (np.integer, int)):
-                            return int(val)
-                        return val
-                    except (IndexError, TypeError, ValueError):
-                        return None
-
-                # Iterate profiles (outer) -> levels (inner)
-                for prof_idx in range(n_prof):
-                    raw_float_id = float_ids[prof_idx]
-                    if isinstance(raw_float_id, bytes):
-                        float_str = raw_float_id.decode(
-                            "utf-8", errors="ignore"
-                        ).strip()
-                    else:
-                        float_str = str(raw_float_id).strip()
-                    float_int = int(float(float_str)) if float_str else int(float_id)
-
-                    cycle_num = get_1d_value(cycles, prof_idx)
-                    lat = get_1d_value(lats, prof_idx)
-                    lon = get_1d_value(lons, prof_idx)
-
-                    # Parse profile timestamp
-                    profile_timestamp = None
-                    try:
-                        juld_val = juldays[prof_idx]
-                        if not np.isnat(juld_val):
-                            ts = (
-                                juld_val - np.datetime64("1970-01-01T00:00:00")
-                            ) / np.timedelta64(1, "s")
-                            profile_timestamp = datetime.fromtimestamp(
-                                float(ts), tz=timezone.utc
-                            )
-                    except Exception:
-                        pass
-
-                    year = profile_timestamp.year if profile_timestamp else None
-                    month = profile_timestamp.month if profile_timestamp else None
-
-                    mode_char = get_1d_value(data_mode, prof_idx)
-                    pos_qc_char = get_1d_value(pos_qc, prof_idx)
-
-                    # Iterate depth levels (one row = one measurement at one depth)
-                    for level_idx in range(n_levels):
-                        pres_val = get_value(pressures, prof_idx, level_idx)
-
-                        # Skip rows without pressure (invalid levels)
-                        if pres_val is None:
-                            continue
-
-                        row = {
-                            "float_id": float_int,
-                            "cycle_number": cycle_num,
-                            "level": level_idx,
-                            "profile_timestamp": profile_timestamp,
-                            "latitude": lat,
-                            "longitude": lon,
-                            "pressure": pres_val,
-                            "temperature": get_value(temps, prof_idx, level_idx),
-                            "salinity": get_value(salts, prof_idx, level_idx),
-                            "position_qc": pos_qc_char,
-                            "pres_qc": get_value(pres_qc, prof_idx, level_idx),
-                            "temp_qc": get_value(temp_qc, prof_idx, level_idx),
-                            "psal_qc": get_value(salt_qc, prof_idx, level_idx),
-                            "temperature_adj": get_value(temp_adj, prof_idx, level_idx),
-                            "salinity_adj": get_value(salt_adj, prof_idx, level_idx),
-                            "pressure_adj": get_value(pres_adj, prof_idx, level_idx),
-                            "temp_adj_qc": get_value(temp_adj_qc, prof_idx, level_idx),
-                            "psal_adj_qc": get_value(salt_adj_qc, prof_idx, level_idx),
-                            "data_mode": mode_char,
-                            "oxygen": get_value(oxygen, prof_idx, level_idx),
-                            "oxygen_qc": get_value(oxygen_qc, prof_idx, level_idx),
-                            "chlorophyll": get_value(chlorophyll, prof_idx, level_idx),
-                            "chlorophyll_qc": get_value(
-                                chlorophyll_qc, prof_idx, level_idx
-                            ),
-                            "nitrate": get_value(nitrate, prof_idx, level_idx),
-                            "nitrate_qc": get_value(nitrate_qc, prof_idx, level_idx),
-                            "year": year,
-                            "month": month,
-                        }
-                        rows.append(row)
-
-                if not rows:
-                    logger.warning("No valid measurements extracted", float_id=float_id)
+            def get_1d_array(var_name: str) -> np.ndarray | None:
+                if var_name not in present:
                     return None
+                arr = ds[var_name]
+                if arr.shape == (n_prof,):
+                    return arr.values
+                return None
+
+            # 2D measurement arrays
+            pressures = get_2d_array("PRES")
+            pres_qc = get_2d_array("PRES_QC")
+            temps = get_2d_array("TEMP")
+            temp_qc = get_2d_array("TEMP_QC")
+            salts = get_2d_array("PSAL")
+            salt_qc = get_2d_array("PSAL_QC")
+
+            # Adjusted values (2D)
+            pres_adj = get_2d_array("PRES_ADJUSTED")
+            temp_adj = get_2d_array("TEMP_ADJUSTED")
+            salt_adj = get_2d_array("PSAL_ADJUSTED")
+            temp_adj_qc = get_2d_array("TEMP_ADJUSTED_QC")
+            salt_adj_qc = get_2d_array("PSAL_ADJUSTED_QC")
+
+            # 1D per-profile arrays
+            data_mode = get_1d_array("DATA_MODE")
+            pos_qc = get_1d_array("POSITION_QC")
+
+            # BGC sensors (often sparse, 2D)
+            oxygen = get_2d_array("OXYGEN")
+            oxygen_qc = get_2d_array("OXYGEN_QC")
+            chlorophyll = get_2d_array("CHLOROPHYLL")
+            chlorophyll_qc = get_2d_array("CHLOROPHYLL_QC")
+            nitrate = get_2d_array("NITRATE")
+            nitrate_qc = get_2d_array("NITRATE_QC")
+
+            # Levels with a pressure reading become rows. One mask over the
+            # whole (N_PROF, N_LEVELS) grid; nonzero() walks it profile by
+            # profile, level by level, which is the output row order.
+            if pressures is None:
+                logger.warning("No valid measurements extracted", float_id=float_id)
+                return None
+            valid = ~np.isnan(pressures)
+            prof_idx, level_idx = np.nonzero(valid)
+            if level_idx.size == 0:
+                logger.warning("No valid measurements extracted", float_id=float_id)
+                return None
+            row_profiles = pa.array(prof_idx)
+
+            # Per-profile values, repeated for each of the profile's rows below
+            prof_float_ids = []
+            for i in range(n_prof):
+                raw_float_id = float_ids[i]
+                if isinstance(raw_float_id, bytes):
+                    float_str = raw_float_id.decode("utf-8", errors="ignore").strip()
+                else:
+                    float_str = str(raw_float_id).strip()
+                prof_float_ids.append(
+                    int(float(float_str)) if float_str else int(float_id)
+                )
 
-                # Build Arrow table from rows - convert list of dicts to columnar format
-                columns = {}
-                for row in rows:
-                    for key, value in row.items():
-                        if key not in columns:
-                            columns[key] = []
-                        columns[key].append(value)
-
-                table = pa.table(columns)
-
-                # Write Parquet file
-                output_path = self.staging_path / f"{float_id}_profiles.parquet"
-                pq.write_table(
-                    table,
-                    output_path,
-                    compression=settings.PARQUET_COMPRESSION,
-                    use_dictionary=["float_id", "cycle_number", "data_mode"],
+            # Profile timestamps in one pass: xarray decodes JULD to
+            # datetime64[ns]; round to the microseconds Parquet stores, and
+            # NaT (missing date) becomes null
+            timestamp_type = PROFILE_SCHEMA.field("profile_timestamp").type
+            if juldays.dtype.kind == "M":
+                nanos = juldays.astype("datetime64[ns]").view(np.int64)
+                prof_timestamps = pa.array(
+                    (nanos + 500) // 1000,
+                    type=timestamp_type,
+                    mask=np.isnat(juldays),
                 )
+            else:
+                prof_timestamps = pa.nulls(n_prof, timestamp_type)
+
+            def per_profile(name: str, arr: np.ndarray | list | None) -> pa.Array:
+                type_ = PROFILE_SCHEMA.field(name).type
+                if arr is None:
+                    values = pa.nulls(n_prof, type_)
+                elif isinstance(arr, list):
+                    values = pa.array(arr, type=type_)
+                else:
+                    values = _arrow_values(arr, type_)
+                return values.take(row_profiles)
+
+            def per_level(name: str, arr: np.ndarray | None) -> pa.Array:
+                type_ = PROFILE_SCHEMA.field(name).type
+                return _level_array(arr, valid, level_idx.size, type_)
+
+            # One row = one measurement at one depth
+            columns = {
+                "float_id": per_profile("float_id", prof_float_ids),
+                "cycle_number": per_profile("cycle_number", cycles),
+                "level": pa.array(level_idx, type=pa.int64()),
+                "profile_timestamp": prof_timestamps.take(row_profiles),
+                "latitude": per_profile("latitude", lats),
+                "longitude": per_profile("longitude", lons),
+                "pressure": per_level("pressure", pressures),
+                "temperature": per_level("temperature", temps),
+                "salinity": per_level("salinity", salts),
+                "position_qc": per_profile("position_qc", pos_qc),
+                "pres_qc": per_level("pres_qc", pres_qc),
+                "temp_qc": per_level("temp_qc", temp_qc),
+                "psal_qc": per_level("psal_qc", salt_qc),
+                "temperature_adj": per_level("temperature_adj", temp_adj),
+                "salinity_adj": per_level("salinity_adj", salt_adj),
+                "pressure_adj": per_level("pressure_adj", pres_adj),
+                "temp_adj_qc": per_level("temp_adj_qc", temp_adj_qc),
+                "psal_adj_qc": per_level("psal_adj_qc", salt_adj_qc),
+                "data_mode": per_profile("data_mode", data_mode),
+                "oxygen": per_level("oxygen", oxygen),
+                "oxygen_qc": per_level("oxygen_qc", oxygen_qc),
+                "chlorophyll": per_level("chlorophyll", chlorophyll),
+                "chlorophyll_qc": per_level("chlorophyll_qc", chlorophyll_qc),
+                "nitrate": per_level("nitrate", nitrate),
+                "nitrate_qc": per_level("nitrate_qc", nitrate_qc),
+                "year": pc.year(prof_timestamps).take(row_profiles),
+                "month": pc.month(prof_timestamps).take(row_profiles),
+            }
+
+            # Arrays are already built with the schema's types, so this only
+            # checks them and fixes the column order; nothing is inferred
+            table = pa.Table.from_pydict(columns, schema=PROFILE_SCHEMA)
+
+            # Write Parquet file
+            output_path = self.staging_path / f"{float_id}_profiles.parquet"
+            pq.write_table(
+                table,
+                output_path,
+                compression=settings.PARQUET_COMPRESSION,
+                use_dictionary=["float_id", "cycle_number", "data_mode"],
+            )
 
-                return str(output_path)
+            return str(output_path)
 
         except Exception as e:
             logger.exception(
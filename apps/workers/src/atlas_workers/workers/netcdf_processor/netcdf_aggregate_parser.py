@@ -1,8 +1,11 @@
+import re
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 import xarray as xr
 
 from ... import FloatMetadata, get_logger
@@ -13,6 +16,17 @@ from ...utils.helper import Helper
 logger = get_logger(__name__)
 helper_instance = Helper()
 
+# tech.nc parameter names that carry a battery voltage reading
+BATTERY_VOLTAGE_PATTERN = "|".join(
+    re.escape(keyword)
+    for keyword in [
+        "BatteryParkNoLoad",
+        "BatteryInitialAtProfileDepth",
+        "VOLTAGE_Battery",
+        "Battery voltage",
+    ]
+)
+
 
 def extract_string(ds: xr.Dataset, var_name: str) -> Optional[str]:
     """Extract and clean string from xarray dataset."""
@@ -95,90 +109,86 @@ def parse_metadata_file(
         return None
 
 
-def get_profile_stats(
-    file_path: Path, metadata: Optional["FloatMetadata"] = None
+def get_dataset_profile_stats(
+    ds: xr.Dataset, float_id: str
 ) -> Optional[dict[str, Any]]:
-    """Extract latest profile + battery health for argo_float_status table."""
+    """Extract latest profile stats from an open prof.nc for argo_float_status table."""
     try:
-        with xr.open_dataset(file_path) as ds:
-            n_prof = ds.sizes.get("N_PROF", 0)
-            if n_prof == 0:
-                return None
+        n_prof = ds.sizes.get("N_PROF", 0)
+        if n_prof == 0:
+            return None
+
+        last_idx = n_prof - 1
+        summary: dict[str, Any] = {"float_id": float_id}
+
+        # Location
+        if "LATITUDE" in ds:
+            lat = float(ds["LATITUDE"].values[last_idx])
+            if not np.isnan(lat):
+                summary["latitude"] = lat
+        if "LONGITUDE" in ds:
+            lon = float(ds["LONGITUDE"].values[last_idx])
+            if not np.isnan(lon):
+                summary["longitude"] = lon
+
+        # Cycle & time
+        if "CYCLE_NUMBER" in ds:
+            cycle = ds["CYCLE_NUMBER"].values[last_idx]
+            if not np.isnan(cycle):
+                summary["cycle_number"] = int(cycle)
+
+        if "JULD" in ds:
+            try:
+                juld = ds["JULD"].values[last_idx]
+                if not np.isnat(juld):
+                    ts = (juld - np.datetime64("1970-01-01T00:00:00")) / np.timedelta64(
+                        1, "s"
+                    )
+                    summary["profile_time"] = datetime.fromtimestamp(
+                        float(ts), tz=timezone.utc
+                    )
+            except Exception:
+                pass
 
-            last_idx = n_prof - 1
-            float_id = file_path.stem.replace("_prof", "")
+        # Sensors
+        for var, key in [
+            ("PRES", "last_depth"),
+            ("TEMP", "last_temp"),
+            ("PSAL", "last_salinity"),
+        ]:
+            if var in ds:
+                arr = ds[var].values[last_idx]
+                valid = arr[~np.isnan(arr) & (arr < 99999)]
+                if len(valid) > 0:
+                    summary[key] = float(valid.max() if var == "PRES" else valid[-1])
 
-            summary: dict[str, Any] = {"float_id": float_id}
+        return summary
 
-            # Location
-            if "LATITUDE" in ds:
-                lat = float(ds["LATITUDE"].values[last_idx])
-                if not np.isnan(lat):
-                    summary["latitude"] = lat
-            if "LONGITUDE" in ds:
-                lon = float(ds["LONGITUDE"].values[last_idx])
-                if not np.isnan(lon):
-                    summary["longitude"] = lon
+    except Exception as e:
+        logger.error("Failed to extract profile stats", float_id=float_id, error=str(e))
+        return None
 
-            # Cycle & time
-            if "CYCLE_NUMBER" in ds:
-                cycle = ds["CYCLE_NUMBER"].values[last_idx]
-                if not np.isnan(cycle):
-                    summary["cycle_number"] = int(cycle)
 
-            if "JULD" in ds:
-                try:
-                    juld = ds["JULD"].values[last_idx]
-                    if not np.isnat(juld):
-                        ts = (
-                            juld - np.datetime64("1970-01-01T00:00:00")
-                        ) / np.timedelta64(1, "s")
-                        summary["profile_time"] = datetime.fromtimestamp(
-                            float(ts), tz=timezone.utc
-                        )
-                except Exception:
-                    pass
-
-            # Sensors
-            for var, key in [
-                ("PRES", "last_depth"),
-                ("TEMP", "last_temp"),
-                ("PSAL", "last_salinity"),
-            ]:
-                if var in ds:
-                    arr = ds[var].values[last_idx]
-                    valid = arr[~np.isnan(arr) & (arr < 99999)]
-                    if len(valid) > 0:
-                        summary[key] = float(
-                            valid.max() if var == "PRES" else valid[-1]
-                        )
-
-            # BATTERY ESTIMATION
-            if metadata:
-                tech_file = file_path.parent / f"{float_id}_tech.nc"
-                current_voltage = None
-
-                if tech_file.exists():
-                    current_voltage = _extract_latest_battery_voltage(tech_file)
-
-                platform_type = metadata.platform_type or "UNKNOWN"
-                cycle_number = summary.get("cycle_number", 0)
-
-                battery_percent = helper_instance.estimate_battery_percent(
-                    platform_type=platform_type,
-                    cycle_number=cycle_number,
-                    current_voltage=current_voltage,
-                    metadata=metadata,  # <- contains battery_packs + launch_date
-                )
-
-                if battery_percent is not None:
-                    summary["battery_percent"] = battery_percent
-
-            return summary
+def estimate_battery_percent(
+    prof_file: Path, summary: dict[str, Any], metadata: "FloatMetadata"
+) -> Optional[float]:
+    """Estimate battery health for a `get_dataset_profile_stats` summary."""
+    float_id = summary["float_id"]
+    tech_file = prof_file.parent / f"{float_id}_tech.nc"
+    current_voltage = None
 
-    except Exception as e:
-        logger.error("Failed to extract profile stats", file=file_path, error=str(e))
-        return None
+    if tech_file.exists():
+        current_voltage = _extract_latest_battery_voltage(tech_file)
+
+    platform_type = metadata.platform_type or "UNKNOWN"
+    cycle_number = summary.get("cycle_number", 0)
+
+    return helper_instance.estimate_battery_percent(
+        platform_type=platform_type,
+        cycle_number=cycle_number,
+        current_voltage=current_voltage,
+        metadata=metadata,  # <- contains battery_packs + launch_date
+    )
 
 
 def _extract_latest_battery_voltage(tech_file: Path) -> float | None:
@@ -194,13 +204,6 @@ def _extract_latest_battery_voltage(tech_file: Path) -> float | None:
             names = ds["TECHNICAL_PARAMETER_NAME"].values.flatten()
             values = ds["TECHNICAL_PARAMETER_VALUE"].values.flatten()
 
-            target_keywords = [
-                "BatteryParkNoLoad",
-                "BatteryInitialAtProfileDepth",
-                "VOLTAGE_Battery",
-                "Battery voltage",
-            ]
-
             latest_voltage = None
             latest_cycle = -1
 
@@ -208,25 +211,26 @@ def _extract_latest_battery_voltage(tech_file: Path) -> float | None:
                 ds["CYCLE_NUMBER"].values.flatten() if "CYCLE_NUMBER" in ds else []
             )
 
-            for i, name_bytes in enumerate(names):
-                name = (
-                    name_bytes.decode("utf-8", errors="ignore")
-                    if isinstance(name_bytes, bytes)
-                    else str(name_bytes)
-                )
-                if any(kw in name for kw in target_keywords):
-                    try:
-                        val_str = values[i]
-                        if isinstance(val_str, bytes):
-                            val_str = val_str.decode("utf-8", errors="ignore")
-                        voltage = float(val_str)
-                        if 5.0 <= voltage <= 35.0:  # Covers Deep Arvor
-                            cycle = int(cycle_nums[i]) if i < len(cycle_nums) else 0
-                            if cycle >= latest_cycle:
-                                latest_voltage = voltage
-                                latest_cycle = cycle
-                    except Exception:
-                        continue
+            # Match every parameter name in one kernel pass (on the raw bytes, no
+            # per-name decode); only the few battery entries reach the loop
+            is_battery = pc.match_substring_regex(
+                pa.array(names, type=pa.binary(), from_pandas=True),
+                BATTERY_VOLTAGE_PATTERN,
+            ).fill_null(False)
+
+            for i in np.flatnonzero(is_battery.to_numpy(zero_copy_only=False)):
+                try:
+                    val_str = values[i]
+                    if isinstance(val_str, bytes):
+                        val_str = val_str.decode("utf-8", errors="ignore")
+                    voltage = float(val_str)
+                    if 5.0 <= voltage <= 35.0:  # Covers Deep Arvor
+                        cycle = int(cycle_nums[i]) if i < len(cycle_nums) else 0
+                        if cycle >= latest_cycle:
+                            latest_voltage = voltage
+                            latest_cycle = cycle
+                except Exception:
+                    continue
 
             return latest_voltage
 
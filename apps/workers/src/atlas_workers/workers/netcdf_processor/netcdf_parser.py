@@ -1,11 +1,15 @@
+import os
 import time
 from pathlib import Path
 from typing import Any
 
+import xarray as xr
+
 from ... import get_logger, settings
 from .converter import ParquetConverter
 from .netcdf_aggregate_parser import (
-    get_profile_stats,
+    estimate_battery_percent,
+    get_dataset_profile_stats,
     parse_metadata_file,
 )
 
@@ -17,6 +21,8 @@ class NetCDFParserWorker:
 
     def __init__(self, stage_path: Path | None = None):
         self.stage_path = Path(stage_path or settings.LOCAL_STAGE_PATH)
+        # One converter per worker so the staging directory is created once per run
+        self.converter = ParquetConverter()
 
     def process_directory(self, float_id: str) -> dict[str, Any]:
         """Main Gateway: Extract metadata and status for a specific float.
@@ -28,7 +34,12 @@ class NetCDFParserWorker:
             Stats Dict containing metadata, status, parquet path, and processing stats
         """
         float_dir = self.stage_path / float_id
-        if not float_dir.exists():
+
+        # One directory scan instead of an exists() stat per file lookup
+        try:
+            with os.scandir(float_dir) as entries:
+                available = {entry.name for entry in entries if entry.is_file()}
+        except FileNotFoundError:
             logger.warning("Float directory not found", float_id=float_id)
             return {"float_id": float_id, "error": "Directory not found"}
 
@@ -41,43 +52,70 @@ class NetCDFParserWorker:
             "parquet_path": None,
         }
 
-        self._prepare_pg_data(float_dir, float_id, stats)
-
-        # Convert to Parquet for R2 staging
+        # prof.nc is opened once and shared by the status summary and the Parquet
+        # conversion; arrays both read are loaded from disk only once
         prof_file = float_dir / f"{float_id}_prof.nc"
-        converter = ParquetConverter()
-        parquet_path = converter.convert(prof_file, float_id)
-        if parquet_path:
-            stats["parquet_path"] = parquet_path
-            logger.debug(
-                "Parquet file conversion done!", float_id=float_id, path=parquet_path
-            )
+        prof_ds = None
+        if prof_file.name in available:
+            try:
+                prof_ds = xr.open_dataset(prof_file)
+            except Exception as e:
+                logger.error(
+                    "Failed to open profile file", float_id=float_id, error=str(e)
+                )
+                stats["errors"] += 1
+
+        try:
+            self._prepare_pg_data(float_dir, float_id, stats, available, prof_ds)
+
+            # Convert to Parquet for R2 staging
+            if prof_ds is None:
+                return stats
+
+            parquet_path = self.converter.convert_dataset(prof_ds, float_id)
+            if parquet_path:
+                stats["parquet_path"] = parquet_path
+                logger.debug(
+                    "Parquet file conversion done!",
+                    float_id=float_id,
+                    path=parquet_path,
+                )
+        finally:
+            if prof_ds is not None:
+                prof_ds.close()
 
         return stats
 
     def _prepare_pg_data(
-        self, float_dir: Path, float_id: str, stats: dict[str, Any]
+        self,
+        float_dir: Path,
+        float_id: str,
+        stats: dict[str, Any],
+        available: set[str],
+        prof_ds: xr.Dataset | None,
     ) -> None:
         """Extract metadata and status from NetCDF files.
 
         Processing order:
         1. Get latest profile time from prof.nc (for status determination)
         2. Extract full metadata using the profile time
-        3. Re-extract profile stats with battery estimation using metadata
+        3. Add battery estimation to those stats using metadata
 
         Args:
             float_dir: Float directory path
             float_id: Float ID
             stats: Statistics dict to update
+            available: File names present in float_dir
+            prof_ds: Open prof.nc dataset, or None if missing or unreadable
         """
         prof_file = float_dir / f"{float_id}_prof.nc"
         latest_profile_time = None
 
         # Step 1: Extract basic profile stats (without battery)
-        if prof_file.exists():
+        if prof_ds is not None:
             try:
                 start = time.time()
-                status_summary = get_profile_stats(prof_file)
+                status_summary = get_dataset_profile_stats(prof_ds, float_id)
                 elapsed = time.time() - start
 
                 if status_summary:
@@ -95,12 +133,12 @@ class NetCDFParserWorker:
                     "Profile extraction failed", float_id=float_id, error=str(e)
                 )
                 stats["errors"] += 1
-        else:
+        elif prof_file.name not in available:
             logger.warning("Profile file not found", float_id=float_id)
 
         # Step 2: Extract metadata (uses profile_time for status determination)
         meta_file = float_dir / f"{float_id}_meta.nc"
-        if meta_file.exists():
+        if meta_file.name in available:
             try:
                 stats["metadata"] = parse_metadata_file(meta_file, latest_profile_time)
                 stats["files_processed"] += 1
@@ -120,18 +158,19 @@ class NetCDFParserWorker:
             logger.error("Metadata file not found", float_id=float_id)
             stats["errors"] += 1
 
-        # Step 3: Re-extract profile stats with battery estimation
-        if prof_file.exists() and stats.get("metadata"):
+        # Step 3: Add battery estimation to the step 1 summary (tech.nc only)
+        if stats.get("status") and stats.get("metadata"):
             try:
-                status_summary = get_profile_stats(prof_file, stats["metadata"])
-                if status_summary:
-                    stats["status"] = status_summary
-                    if "battery_percent" in status_summary:
-                        logger.debug(
-                            "Battery estimation completed",
-                            float_id=float_id,
-                            battery_percent=status_summary["battery_percent"],
-                        )
+                battery_percent = estimate_battery_percent(
+                    prof_file, stats["status"], stats["metadata"]
+                )
+                if battery_percent is not None:
+                    stats["status"]["battery_percent"] = battery_percent
+                    logger.debug(
+                        "Battery estimation completed",
+                        float_id=float_id,
+                        battery_percent=battery_percent,
+                    )
             except Exception as e:
                 logger.warning(
                     "Battery estimation failed", float_id=float_id, error=str(e)
@@ -1,7 +1,14 @@
 """Tests for ARGO Sync Worker."""
 
+import asyncio
+import email.utils
+import os
+import re
+
+import httpx
 import pytest
 from atlas_workers.workers import ArgoSyncWorker
+from atlas_workers.workers.argo_sync import sync as sync_module
 
 
 @pytest.fixture
@@ -10,6 +17,27 @@ def sync_worker(tmp_path):
     return ArgoSyncWorker(cache_path=tmp_path)
 
 
+@pytest.fixture
+def run_with_handler(tmp_path):
+    """Run an async action on a sync worker whose HTTP requests go to a handler.
+
+    The worker stages into tmp_path and is closed once the action finishes.
+    """
+
+    def run(handler, action):
+        async def main():
+            worker = ArgoSyncWorker(dac="incois", stage_path=tmp_path)
+            worker._client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+            try:
+                return await action(worker)
+            finally:
+                await worker.aclose()
+
+        return asyncio.run(main())
+
+    return run
+
+
 def test_sync_worker_initialization(tmp_path):
     """Test worker initialization."""
     worker = ArgoSyncWorker(cache_path=tmp_path)
@@ -50,5 +78,357 @@ def test_manifest_management(sync_worker):
     assert worker2.manifest.get("test_key") == "test_value"
 
 
+def test_manifest_journal_replay(tmp_path):
+    """Test results journaled since the last snapshot survive a reload."""
+    worker = ArgoSyncWorker(stage_path=tmp_path)
+    manifest = worker._load_manifest()
+    worker._record_result(manifest, "2902224", False)
+    worker._save_manifest(manifest)
+    assert not worker.journal_path.exists()
+
+    # Simulate a crash after these results were journaled but never snapshotted
+    worker._record_result(manifest, "2902224", True)
+    worker._record_result(manifest, "2902225", False)
+
+    reloaded = ArgoSyncWorker(stage_path=tmp_path)._load_manifest()
+    assert reloaded == {"downloaded": {"2902224"}, "failed": {"2902225"}}
+
+
+def test_manifest_journal_torn_line(tmp_path):
+    """Test a torn journal line is dropped and later entries still replay."""
+    worker = ArgoSyncWorker(stage_path=tmp_path)
+    manifest = worker._load_manifest()
+    worker._record_result(manifest, "2902224", True)
+    worker._close_journal()
+    # Simulate a crash part-way through writing the next entry
+    with open(worker.journal_path, "ab") as f:
+        f.write(b'{"float_id":"2902225","succ')
+
+    worker = ArgoSyncWorker(stage_path=tmp_path)
+    manifest = worker._load_manifest()
+    assert manifest == {"downloaded": {"2902224"}, "failed": set()}
+    worker._record_result(manifest, "2902226", False)
+    worker._close_journal()
+
+    reloaded = ArgoSyncWorker(stage_path=tmp_path)._load_manifest()
+    assert reloaded == {"downloaded": {"2902224"}, "failed": {"2902226"}}
+
+
+def test_parse_index_for_floats(tmp_path):
+    """Test float IDs are extracted for the worker's DAC only."""
+    worker = ArgoSyncWorker(dac="incois", stage_path=tmp_path)
+    sample_index = b"""# Title : Metadata directory file of the Argo Global Data Assembly Center
+# GDAC node : CORIOLIS
+file,profiler_type,institution,date_update
+aoml/13857/13857_meta.nc,845,AO,20180309104508
+incois/2902224/2902224_meta.nc,844,IN,20251106000000
+incois/2902224/profiles/R2902224_001.nc,844,IN,20251106000000
+incois/2902225/2902225_meta.nc,844,IN,20251106000000
+incoisx/1900001/1900001_meta.nc,844,IN,20251106000000
+"""
+
+    index_file = tmp_path / "ar_index_global_meta.txt"
+    index_file.write_bytes(sample_index)
+    assert worker._parse_index_for_floats(index_file) == {"2902224", "2902225"}
+
+    index_file.write_bytes(b"# header only\n")
+    assert worker._parse_index_for_floats(index_file) == set()
+
+
+def test_download_ranged_reassembles_file(tmp_path, monkeypatch):
+    """Test large files are fetched as parallel byte ranges and reassembled."""
+    payload = bytes(range(256)) * 40
+    etag = '"v1"'
+    monkeypatch.setattr(sync_module, "RANGED_DOWNLOAD_PARTS", 3)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        assert request.headers["If-Range"] == etag
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers["Range"])
+        assert match is not None
+        start, end = int(match[1]), int(match[2])
+        return httpx.Response(
+            206,
+            content=payload[start : end + 1],
+            headers={"Content-Range": f"bytes {start}-{end}/{len(payload)}"},
+        )
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            await ArgoSyncWorker(stage_path=tmp_path)._download_ranged(
+                client,
+                "https://argo.test/big.nc",
+                tmp_path / "big.nc",
+                len(payload),
+                etag,
+            )
+
+    asyncio.run(run())
+    assert (tmp_path / "big.nc").read_bytes() == payload
+
+
+def test_download_ranged_cancels_parts_on_failure(tmp_path, monkeypatch):
+    """Test a failed part cancels the others before the file is closed."""
+    size = 300
+    monkeypatch.setattr(sync_module, "RANGED_DOWNLOAD_PARTS", 3)
+    cancelled: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        start, end = map(int, request.headers["Range"][6:].split("-"))
+        if start == 0:
+            return httpx.Response(500)
+
+        async def stalled_body():
+            yield b"x"
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(start)
+                raise
+            yield b"y" * (end - start)
+
+        return httpx.Response(
+            206,
+            content=stalled_body(),
+            headers={"Content-Range": f"bytes {start}-{end}/{size}"},
+        )
+
+    async def run() -> None:
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+            with pytest.raises(httpx.HTTPStatusError):
+                await ArgoSyncWorker(stage_path=tmp_path)._download_ranged(
+                    client,
+                    "https://argo.test/big.nc",
+                    tmp_path / "big.nc",
+                    size,
+                    '"v1"',
+                )
+            # No part is left running to write into a closed (or reused) fd
+            assert asyncio.all_tasks() == {asyncio.current_task()}
+
+    asyncio.run(run())
+    assert sorted(cancelled) == [100, 200]
+
+
+def test_sync_falls_back_when_ranges_ignored(tmp_path, monkeypatch, run_with_handler):
+    """Test a large file is fetched as one stream if Range requests are ignored."""
+    payload = b"0123456789" * 10
+    last_modified = "Thu, 06 Nov 2025 00:00:00 GMT"
+    monkeypatch.setattr(sync_module, "RANGED_DOWNLOAD_MIN_SIZE", 10)
+    ranges: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("_prof.nc"):
+            return httpx.Response(404)
+        ranges.append(request.headers.get("Range"))
+        # Advertises byte ranges but always answers with the whole file
+        return httpx.Response(
+            200,
+            content=payload,
+            headers={"Accept-Ranges": "bytes", "Last-Modified": last_modified},
+        )
+
+    assert run_with_handler(handler, lambda worker: worker.sync("2902224"))
+    float_dir = tmp_path / "2902224"
+    assert (float_dir / "2902224_prof.nc").read_bytes() == payload
+    assert not list(float_dir.glob("*.part"))
+    assert ranges[0] is None
+    assert ranges[-1] is None
+    assert len(ranges) == 2 + sync_module.RANGED_DOWNLOAD_PARTS
+
+
+def test_sync_restarts_when_file_replaced_mid_download(
+    tmp_path, monkeypatch, run_with_handler
+):
+    """Test ranged parts from a newer version of the file are not stitched in."""
+    old, new = b"a" * 100, b"b" * 120
+    monkeypatch.setattr(sync_module, "RANGED_DOWNLOAD_MIN_SIZE", 10)
+    requests: list[httpx.Request] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("_prof.nc"):
+            return httpx.Response(404)
+        requests.append(request)
+        # The first response is the old file; it is replaced right after
+        payload = old if len(requests) == 1 else new
+        headers = {"Accept-Ranges": "bytes", "ETag": f'"{len(payload)}"'}
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", request.headers.get("Range", ""))
+        if match is None:
+            return httpx.Response(200, content=payload, headers=headers)
+        # A server that ignores If-Range serves ranges of the new file
+        start, end = int(match[1]), int(match[2])
+        headers["Content-Range"] = f"bytes {start}-{end}/{len(payload)}"
+        return httpx.Response(206, content=payload[start : end + 1], headers=headers)
+
+    assert run_with_handler(handler, lambda worker: worker.sync("2902224"))
+    float_dir = tmp_path / "2902224"
+    assert (float_dir / "2902224_prof.nc").read_bytes() == new
+    assert not list(float_dir.glob("*.part"))
+    assert {r.headers.get("If-Range") for r in requests[1:-1]} == {'"100"'}
+    assert "Range" not in requests[-1].headers
+
+
+def test_sync_floats_concurrent_records_every_float(
+    tmp_path, monkeypatch, run_with_handler
+):
+    """Test the worker pool drains the queue and journals each float's result."""
+    monkeypatch.setattr(sync_module, "MAX_CONCURRENT_DOWNLOADS", 2)
+    ok = {"2902224", "2902225", "2902226"}
+    float_ids = ok | {"2902227", "2902228"}
+    in_flight = peak = 0
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        float_id = request.url.path.rsplit("/", 2)[-2]
+        if float_id in ok and request.url.path.endswith("_prof.nc"):
+            return httpx.Response(200, content=b"profile")
+        return httpx.Response(404)
+
+    async def action(worker: ArgoSyncWorker):
+        original_sync = worker.sync
+
+        async def sync(float_id: str) -> bool:
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            try:
+                await asyncio.sleep(0)
+                if float_id == "2902228":
+                    raise RuntimeError("unexpected failure")
+                return await original_sync(float_id)
+            finally:
+                in_flight -= 1
+
+        worker.sync = sync
+        manifest = worker._load_manifest()
+        return await worker._sync_floats_concurrent(float_ids, manifest)
+
+    successful, failed = run_with_handler(handler, action)
+    assert sorted(successful) == sorted(ok)
+    # 2902227 has no files; 2902228 raising does not stop the other workers
+    assert sorted(failed) == ["2902227", "2902228"]
+    assert peak == 2
+    # Every result reached the journal, so a crash now would lose nothing
+    reloaded = ArgoSyncWorker(stage_path=tmp_path)._load_manifest()
+    assert reloaded == {"downloaded": ok, "failed": {"2902227", "2902228"}}
+
+
+def test_update_returns_new_float_ids(tmp_path, run_with_handler):
+    """Test update() reports only the floats this run downloaded."""
+    weekly_index = b"""# Title : Profile directory file of the Argo GDAC
+file,date,latitude,longitude,ocean,profiler_type,institution,date_update
+incois/2902224/profiles/R2902224_101.nc,20251106,-10.0,72.0,I,844,IN,20251106
+incois/2902225/profiles/R2902225_050.nc,20251106,-11.0,73.0,I,844,IN,20251106
+incois/2902226/profiles/R2902226_012.nc,20251106,-12.0,74.0,I,844,IN,20251106
+"""
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        if path.endswith("ar_index_this_week_prof.txt"):
+            return httpx.Response(200, content=weekly_index)
+        if path.endswith("2902225_prof.nc"):
+            return httpx.Response(200, content=b"profile")
+        return httpx.Response(404)
+
+    # 2902224 was fetched by an earlier run; 2902226 has no files to fetch
+    worker = ArgoSyncWorker(stage_path=tmp_path)
+    manifest = worker._load_manifest()
+    worker._record_result(manifest, "2902224", True)
+    worker._save_manifest(manifest)
+
+    async def update_twice(worker: ArgoSyncWorker) -> tuple[dict, dict]:
+        return await worker.update(), await worker.update()
+
+    first, second = run_with_handler(handler, update_twice)
+    assert first["new_float_ids"] == ["2902225"]
+    assert (first["total"], first["new"], first["failed"]) == (3, 1, 1)
+    # The failed float is retried, but nothing new is downloaded
+    assert second["new_float_ids"] == []
+    assert (second["new"], second["failed"]) == (0, 1)
+
+
+def test_sync_retries_transient_errors(tmp_path, monkeypatch, run_with_handler):
+    """Test a 5xx response is retried while a 404 is treated as a missing file."""
+    monkeypatch.setattr(sync_module, "_backoff_delay", lambda attempt: 0)
+    calls: dict[str, int] = {}
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        filename = request.url.path.rsplit("/", 1)[-1]
+        calls[filename] = calls.get(filename, 0) + 1
+        if filename != "2902224_prof.nc":
+            return httpx.Response(404)
+        if calls[filename] == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, content=b"profile")
+
+    assert run_with_handler(handler, lambda worker: worker.sync("2902224"))
+    assert (tmp_path / "2902224" / "2902224_prof.nc").read_bytes() == b"profile"
+    assert calls == {
+        "2902224_meta.nc": 1,
+        "2902224_tech.nc": 1,
+        "2902224_prof.nc": 2,
+        "2902224_Rtraj.nc": 1,
+    }
+
+
+def test_sync_revalidates_existing_files(tmp_path, run_with_handler):
+    """Test a re-sync sends If-Modified-Since and keeps the local copy on 304."""
+    last_modified = "Thu, 06 Nov 2025 00:00:00 GMT"
+    seen: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("_prof.nc"):
+            return httpx.Response(404)
+        since = request.headers.get("If-Modified-Since")
+        seen.append(since)
+        if since == last_modified:
+            return httpx.Response(304)
+        return httpx.Response(
+            200, content=b"profile", headers={"Last-Modified": last_modified}
+        )
+
+    async def sync_twice(worker: ArgoSyncWorker) -> None:
+        assert await worker.sync("2902224")
+        assert await worker.sync("2902224")
+
+    run_with_handler(handler, sync_twice)
+    assert seen == [None, last_modified]
+    float_dir = tmp_path / "2902224"
+    assert (float_dir / "2902224_prof.nc").read_bytes() == b"profile"
+    assert not list(float_dir.glob("*.part"))
+
+
+@pytest.mark.parametrize("remote_changed", [False, True])
+def test_sync_resumes_partial_download(tmp_path, remote_changed, run_with_handler):
+    """Test a leftover .part is resumed only while the remote file is unchanged."""
+    payload = b"0123456789" * 10
+    last_modified = "Thu, 06 Nov 2025 00:00:00 GMT"
+    float_dir = tmp_path / "2902224"
+    float_dir.mkdir()
+    part_path = float_dir / "2902224_prof.nc.part"
+    part_path.write_bytes(payload[:40])
+    # The .part mtime records the Last-Modified it was cut from
+    mtime = (
+        0
+        if remote_changed
+        else email.utils.parsedate_to_datetime(last_modified).timestamp()
+    )
+    os.utime(part_path, (mtime, mtime))
+    ranges: list[str | None] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if not request.url.path.endswith("_prof.nc"):
+            return httpx.Response(404)
+        ranges.append(request.headers.get("Range"))
+        headers = {"Last-Modified": last_modified}
+        if request.headers.get("If-Range") == last_modified:
+            headers["Content-Range"] = f"bytes 40-{len(payload) - 1}/{len(payload)}"
+            return httpx.Response(206, content=payload[40:], headers=headers)
+        return httpx.Response(200, content=payload, headers=headers)
+
+    assert run_with_handler(handler, lambda worker: worker.sync("2902224"))
+    assert ranges == ["bytes=40-"]
+    assert (float_dir / "2902224_prof.nc").read_bytes() == payload
+    assert not part_path.exists()
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
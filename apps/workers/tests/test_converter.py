@@ -0,0 +1,161 @@
+"""Tests for the NetCDF to Parquet converter."""
+
+import math
+from pathlib import Path
+
+import numpy as np
+import pyarrow.parquet as pq
+import pytest
+import xarray as xr
+from atlas_workers.workers.netcdf_processor.converter import (
+    PROFILE_SCHEMA,
+    ParquetConverter,
+)
+
+FILL = 99999.0
+SAMPLE_DIR = Path(__file__).resolve().parents[3] / "data" / "incois"
+
+
+def _chars(rows):
+    """Fixed-width char array, as ARGO stores QC flags and modes."""
+    return np.array(rows, dtype="S1")
+
+
+@pytest.fixture
+def prof_dataset(tmp_path):
+    """Open a small prof.nc with three profiles of four levels.
+
+    Profile 2 has no pressure at all; profile 3 has no date. TEMP is missing
+    at one valid level and TEMP_QC is filled at another. There are no BGC
+    variables.
+    """
+    nan = np.nan
+    pres = np.array(
+        [[5.0, 10.0, nan, nan], [nan, nan, nan, nan], [nan, 20.0, 30.0, 40.0]],
+        dtype="float32",
+    )
+    temp = np.array(
+        [[15.5, nan, nan, nan], [nan, nan, nan, nan], [nan, 12.0, 11.0, 10.0]],
+        dtype="float32",
+    )
+    temp_qc = np.array(
+        [[b"1", b"1", b" ", b" "], [b" "] * 4, [b" ", b" ", b"4", b"1"]],
+        dtype="S1",
+    )
+    ds = xr.Dataset(
+        {
+            "PLATFORM_NUMBER": (("N_PROF",), np.array([b"2902224 "] * 3)),
+            "CYCLE_NUMBER": (("N_PROF",), np.array([1, 2, 3], dtype="int32")),
+            "JULD": (("N_PROF",), np.array([0.5, 1.0, 999999.0])),
+            "LATITUDE": (("N_PROF",), np.array([-10.0, -10.5, -11.0])),
+            "LONGITUDE": (("N_PROF",), np.array([72.0, 72.5, 73.0])),
+            "DATA_MODE": (("N_PROF",), _chars([b"R", b"R", b"D"])),
+            "POSITION_QC": (("N_PROF",), _chars([b"1", b"1", b"2"])),
+            "PRES": (("N_PROF", "N_LEVELS"), pres),
+            "TEMP": (("N_PROF", "N_LEVELS"), temp),
+            "TEMP_QC": (("N_PROF", "N_LEVELS"), temp_qc),
+        }
+    )
+    ds["JULD"].attrs["units"] = "days since 1950-01-01 00:00:00 UTC"
+
+    path = tmp_path / "2902224_prof.nc"
+    ds.to_netcdf(
+        path,
+        format="NETCDF3_CLASSIC",
+        encoding={
+            "JULD": {"_FillValue": 999999.0},
+            "PRES": {"_FillValue": FILL},
+            "TEMP": {"_FillValue": FILL},
+            "TEMP_QC": {"_FillValue": b" "},
+        },
+    )
+    with xr.open_dataset(path) as opened:
+        yield opened
+
+
+@pytest.fixture
+def converter(tmp_path):
+    """Create a converter staging into a temp directory."""
+    return ParquetConverter(staging_path=tmp_path / "parquet")
+
+
+def test_convert_dataset_writes_schema(converter, prof_dataset):
+    """Columns follow PROFILE_SCHEMA, including BGC columns the file lacks."""
+    output = converter.convert_dataset(prof_dataset, "2902224")
+
+    assert output == str(converter.staging_path / "2902224_profiles.parquet")
+    table = pq.read_table(output)
+    assert table.schema.remove_metadata() == PROFILE_SCHEMA
+    for name in ("oxygen", "oxygen_qc", "chlorophyll", "nitrate_qc"):
+        assert table.column(name).null_count == table.num_rows
+
+
+def test_convert_dataset_rows_per_valid_pressure(converter, prof_dataset):
+    """One row per level with a pressure, profile by profile."""
+    table = pq.read_table(converter.convert_dataset(prof_dataset, "2902224"))
+
+    assert table.num_rows == 5
+    assert table.column("cycle_number").to_pylist() == [1, 1, 3, 3, 3]
+    assert table.column("level").to_pylist() == [0, 1, 1, 2, 3]
+    assert table.column("pressure").to_pylist() == [5, 10, 20, 30, 40]
+    assert table.column("float_id").to_pylist() == [2902224] * 5
+    assert table.column("latitude").to_pylist() == [-10.0, -10.0, -11.0, -11.0, -11.0]
+    assert table.column("data_mode").to_pylist() == ["R", "R", "D", "D", "D"]
+    assert table.column("position_qc").to_pylist() == ["1", "1", "2", "2", "2"]
+
+
+def test_convert_dataset_nulls_missing_values(converter, prof_dataset):
+    """NaN measurements and filled QC flags become nulls, not NaN or blanks."""
+    table = pq.read_table(converter.convert_dataset(prof_dataset, "2902224"))
+
+    assert table.column("temperature").to_pylist() == [15.5, None, 12.0, 11.0, 10.0]
+    assert table.column("temp_qc").to_pylist() == ["1", "1", None, "4", "1"]
+    # Variables absent from the file are all-null columns
+    assert table.column("salinity").null_count == 5
+    assert table.column("psal_qc").null_count == 5
+
+
+def test_convert_dataset_missing_date(converter, prof_dataset):
+    """A profile without a date keeps its rows with null timestamp parts."""
+    table = pq.read_table(converter.convert_dataset(prof_dataset, "2902224"))
+
+    timestamps = table.column("profile_timestamp").to_pylist()
+    assert [ts.isoformat() for ts in timestamps[:2]] == [
+        "1950-01-01T12:00:00+00:00"
+    ] * 2
+    assert timestamps[2:] == [None] * 3
+    assert table.column("year").to_pylist() == [1950, 1950, None, None, None]
+    assert table.column("month").to_pylist() == [1, 1, None, None, None]
+
+
+def test_convert_dataset_without_pressure(converter, prof_dataset):
+    """Nothing is written when no level has a pressure."""
+    ds = prof_dataset.drop_vars("PRES")
+
+    assert converter.convert_dataset(ds, "2902224") is None
+    assert not list(converter.staging_path.iterdir())
+
+
+@pytest.mark.skipif(
+    not (SAMPLE_DIR / "2902226" / "2902226_prof.nc").exists(),
+    reason="Sample ARGO data not available",
+)
+def test_convert_dataset_sample_float(converter):
+    """Spot-check the output for a real INCOIS float."""
+    path = SAMPLE_DIR / "2902226" / "2902226_prof.nc"
+    with xr.open_dataset(path) as ds:
+        table = pq.read_table(converter.convert_dataset(ds, "2902226"))
+
+    assert table.num_rows == 5368
+    first = table.slice(0, 1).to_pylist()[0]
+    assert first["cycle_number"] == 1
+    assert first["level"] == 0
+    assert first["profile_timestamp"].isoformat() == "2017-02-19T18:20:27+00:00"
+    assert first["data_mode"] == "D"
+    assert first["temp_qc"] == "1"
+    assert math.isclose(first["pressure"], 3.7, rel_tol=1e-6)
+    assert math.isclose(first["salinity_adj"], 33.76273, rel_tol=1e-6)
+    last = table.slice(table.num_rows - 1, 1).to_pylist()[0]
+    assert (last["cycle_number"], last["level"], last["data_mode"]) == (124, 29, "R")
+    assert table.column("salinity_adj").null_count == 56
+    assert table.column("oxygen").null_count == table.num_rows
@@ -0,0 +1,78 @@
+"""Tests for the sync pipeline entry point."""
+
+import os
+import time
+
+import pytest
+from atlas_workers import main
+
+
+class RecordingParser:
+    """Stand-in for NetCDFParserWorker that records which process parsed."""
+
+    def process_directory(self, float_id):
+        if float_id == "bad":
+            raise ValueError("corrupt prof.nc")
+        return {"float_id": float_id, "pid": os.getpid()}
+
+
+class SlowParser:
+    """Stand-in parser that takes a while and leaves a marker per float."""
+
+    def __init__(self, marker_dir):
+        self.marker_dir = marker_dir
+
+    def process_directory(self, float_id):
+        time.sleep(0.1)
+        (self.marker_dir / float_id).touch()
+        return {"float_id": float_id}
+
+
+@pytest.fixture
+def float_ids():
+    return ["2902224", "bad", "2902225"]
+
+
+def test_parse_floats_uses_process_pool(monkeypatch, float_ids):
+    """Floats are parsed in worker processes and yielded in input order."""
+    monkeypatch.setattr(main.settings, "MAX_WORKERS", 2)
+
+    parsed = list(main._parse_floats(RecordingParser(), float_ids))
+
+    assert [fid for fid, _ in parsed] == float_ids
+    assert parsed[1][1] == {"float_id": "bad", "error": "corrupt prof.nc"}
+    pids = {parsed[0][1]["pid"], parsed[2][1]["pid"]}
+    assert os.getpid() not in pids
+
+
+def test_parse_floats_falls_back_to_serial(monkeypatch, float_ids):
+    """Without a usable process pool, floats are parsed in this process."""
+    monkeypatch.setattr(main.settings, "MAX_WORKERS", 2)
+
+    def no_pool(*args, **kwargs):
+        raise OSError("[Errno 38] Function not implemented")
+
+    monkeypatch.setattr(main, "ProcessPoolExecutor", no_pool)
+
+    parsed = list(main._parse_floats(RecordingParser(), float_ids))
+
+    assert [fid for fid, _ in parsed] == float_ids
+    assert parsed[0][1] == {"float_id": "2902224", "pid": os.getpid()}
+    assert parsed[1][1] == {"float_id": "bad", "error": "corrupt prof.nc"}
+    assert parsed[2][1]["pid"] == os.getpid()
+
+
+def test_parse_floats_stops_when_consumer_raises(monkeypatch, tmp_path):
+    """Floats still queued are not parsed once the consumer gives up."""
+    monkeypatch.setattr(main.settings, "MAX_WORKERS", 2)
+    float_ids = [str(2902200 + i) for i in range(20)]
+
+    def upload_all():
+        for _fid, _result in main._parse_floats(SlowParser(tmp_path), float_ids):
+            raise RuntimeError("database unavailable")
+
+    with pytest.raises(RuntimeError):
+        upload_all()
+
+    # Only the floats already handed to a worker process were parsed
+    assert len(list(tmp_path.iterdir())) < len(float_ids) // 2